@@ -2,7 +2,28 @@
 TTS service package initializer.
 
 Re-exports the legacy Kokoro TTS module to maintain backward compatibility
-after reorganizing the project structure.
+after reorganizing the project structure. The legacy module pulls in the
+Kokoro/ONNX and document-parsing stacks, so it is only imported on first
+attribute access rather than whenever any ``app.*`` submodule is loaded.
 """
 
-from app.core.tts_service import *  # noqa: F401,F403
+from importlib.util import find_spec
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    # The import system probes this package for its own submodules (``from app
+    # import utils`` checks for a ``utils`` attribute first); neither those nor
+    # dunder lookups should load the legacy stack.
+    if (name.startswith("__") and name.endswith("__")) or find_spec(f"{__name__}.{name}") is not None:
+        raise AttributeError(f"module 'app' has no attribute {name!r}")
+
+    try:
+        from app.core import tts_service
+    except ImportError as exc:
+        raise AttributeError(f"module 'app' has no attribute {name!r} ({exc})") from exc
+
+    try:
+        return getattr(tts_service, name)
+    except AttributeError:
+        raise AttributeError(f"module 'app' has no attribute {name!r}") from None
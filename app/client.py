@@ -1,7 +1,9 @@
 import asyncio
 import websockets
 import json
+import msgpack
 import os
+import re
 import time
 
 # Available voices
@@ -11,14 +13,37 @@ available_voices = {
 }
 
 MAX_CHUNK_SIZE = 1000  # You can tune this based on what your server handles well
+MAX_PARALLEL_CONNECTIONS = 4  # Keep well below the server's TTS_MAX_CONNECTIONS
 
-
-def split_text(text, chunk_size=MAX_CHUNK_SIZE):
-    """Split large input text into smaller chunks."""
-    return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
 
 
-async def send_chunk(uri, chunk_text, voice, chunk_index):
+def split_text(text, chunk_size=MAX_CHUNK_SIZE):
+    """Split large input text into chunks of whole sentences.
+
+    Sentences are packed together while they fit in ``chunk_size``; a single
+    sentence longer than that is cut into ``chunk_size`` pieces.
+    """
+    chunks = []
+    buf = []
+    size = 0
+    for sentence in _SENTENCE_SPLIT.split(text.strip()):
+        if not sentence:
+            continue
+        if buf and size + 1 + len(sentence) > chunk_size:
+            chunks.append(" ".join(buf))
+            buf, size = [], 0
+        while len(sentence) > chunk_size:
+            chunks.append(sentence[:chunk_size])
+            sentence = sentence[chunk_size:]
+        size += len(sentence) + (1 if buf else 0)
+        buf.append(sentence)
+    if buf:
+        chunks.append(" ".join(buf))
+    return chunks
+
+
+async def send_chunk(websocket, chunk_text, voice, chunk_index):
     request = {
         "text": chunk_text,
         "lang": "en-us",
@@ -27,23 +52,42 @@ async def send_chunk(uri, chunk_text, voice, chunk_index):
         "format": "wav"
     }
 
+    # MessagePack avoids escape-scanning the (large) text field; replies stay JSON
+    await websocket.send(msgpack.packb(request))
+    print(f"[Chunk {chunk_index}] Sent request.")
+
+    audio = []
+    async for message in websocket:
+        if isinstance(message, bytes):
+            audio.append(message)  # audio arrives in chunks; the "ok" reply follows the last
+            continue
+        data = json.loads(message)
+        if data["status"] == "progress":
+            print(f"[Chunk {chunk_index}] Progress: {data['progress']*100:.1f}%")
+        elif data["status"] == "ok":
+            os.makedirs("output", exist_ok=True)
+            path = os.path.join("output", f"chunk_{chunk_index:04d}.{data['format']}")
+            with open(path, "wb") as f:
+                f.write(b"".join(audio))
+            print(f"[Chunk {chunk_index}] Audio received: {path} ({data['duration']:.2f}s)")
+            return path
+        elif data["status"] == "error":
+            print(f"[Chunk {chunk_index}] Error: {data['message']}")
+            return None
+    return None
+
+
+async def chunk_worker(uri, queue, voice, results):
+    """Drain chunks from the shared queue over one persistent connection."""
     try:
-        async with websockets.connect(uri, ping_interval=30, ping_timeout=60) as websocket:
-            await websocket.send(json.dumps(request))
-            print(f"[Chunk {chunk_index}] Sent request.")
-
-            async for message in websocket:
-                data = json.loads(message)
-                if data["status"] == "progress":
-                    print(f"[Chunk {chunk_index}] Progress: {data['progress']*100:.1f}%")
-                elif data["status"] == "ok":
-                    print(f"[Chunk {chunk_index}] Audio generated: {data['file']} ({data['format']})")
-                    break
-                elif data["status"] == "error":
-                    print(f"[Chunk {chunk_index}] Error: {data['message']}")
-                    break
+        async with websockets.connect(
+            uri, ping_interval=30, ping_timeout=60, compression=None
+        ) as websocket:
+            while not queue.empty():
+                chunk_index, chunk_text = queue.get_nowait()
+                results[chunk_index] = await send_chunk(websocket, chunk_text, voice, chunk_index)
     except Exception as e:
-        print(f"[Chunk {chunk_index}] Failed with error: {e}")
+        print(f"Connection failed with error: {e}")
 
 
 async def tts_client():
@@ -73,9 +117,19 @@ async def tts_client():
     chunks = split_text(text)
     print(f"\nTotal chunks to process: {len(chunks)}")
 
-    # Send each chunk separately
+    # Fan the chunks out over a small pool of persistent connections.
+    queue = asyncio.Queue()
     for i, chunk in enumerate(chunks, start=1):
-        await send_chunk(uri, chunk, voice, i)
+        queue.put_nowait((i, chunk))
+
+    results = {}
+    workers = min(MAX_PARALLEL_CONNECTIONS, len(chunks))
+    await asyncio.gather(*(chunk_worker(uri, queue, voice, results) for _ in range(workers)))
+
+    # Report outputs in chunk order so they can be concatenated deterministically
+    print("\nGenerated files (in order):")
+    for i in range(1, len(chunks) + 1):
+        print(f"{i}: {results.get(i) or 'FAILED'}")
 
 
 if __name__ == "__main__":
@@ -6,17 +6,51 @@ without changing request handling code.
 """
 from __future__ import annotations
 
+import contextlib
+import io
+import re
 import sys
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Iterable, List, Tuple
 
-import torchaudio  # type: ignore
+import soundfile as sf  # type: ignore
 
 from app.utils.logger import get_logger
 
+# Update tags: backends yield (KIND_PROGRESS, fraction) while working and
+# finish with (KIND_DONE, audio_bytes, fmt, duration_seconds).
+KIND_PROGRESS, KIND_DONE = 0, 1
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?\u3002\uff01\uff1f])\s+")
+
+
+def _split_segments(text: str, max_chars: int) -> List[str]:
+    """Group whole sentences into segments of at most ``max_chars``."""
+    segments: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_SPLIT.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            segments.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        segments.append(current)
+    return segments
+
 
 class BaseBackend:
-    """Minimal interface for a synthesis backend."""
+    """Minimal interface for a synthesis backend.
+
+    ``synthesize`` yields ``(KIND_PROGRESS, fraction)`` updates and finishes
+    with ``(KIND_DONE, audio, fmt, duration)``; the encoded audio is built in
+    memory and never touches disk here.
+    """
 
     name: str = "base"
 
@@ -28,8 +62,7 @@ class BaseBackend:
         voice: str,
         speed: float,
         fmt: str,
-        output_file: Path,
-    ) -> Iterable[Dict]:  # pragma: no cover - small glue wrapper
+    ) -> Iterable[Tuple]:  # pragma: no cover - small glue wrapper
         raise NotImplementedError
 
 
@@ -42,6 +75,9 @@ class KokoroBackend(BaseBackend):
         self._kokoro = kokoro_legacy
         self.model_path = model_path
         self.voices_path = voices_path
+        # One ONNX session shared by every request; its run() is thread-safe.
+        kokoro_legacy.check_required_files(model_path, voices_path)
+        self._model = kokoro_legacy.Kokoro(model_path, voices_path)
 
     def synthesize(
         self,
@@ -51,11 +87,11 @@ class KokoroBackend(BaseBackend):
         voice: str,
         speed: float,
         fmt: str,
-        output_file: Path,
     ):
-        yield from self._kokoro.convert_text_to_audio_text(
+        buffer = io.BytesIO()
+        for update in self._kokoro.convert_text_to_audio_text(
             text=text,
-            output_file=str(output_file),
+            output_file=buffer,
             voice=voice,
             speed=speed,
             lang=lang,
@@ -63,17 +99,33 @@ class KokoroBackend(BaseBackend):
             debug=False,
             model_path=self.model_path,
             voices_path=self.voices_path,
-        )
+            kokoro=self._model,
+        ):
+            if "progress" in update:
+                yield KIND_PROGRESS, update["progress"]
+            else:
+                yield KIND_DONE, buffer.getvalue(), fmt, update["duration"]
 
 
 class ChatterboxBackend(BaseBackend):
     name = "chatterbox"
 
-    def __init__(self, *, device: str = "cuda") -> None:
+    # Chatterbox has no streaming decode, so long inputs are generated one
+    # sentence group at a time to report progress and write audio early.
+    segment_chars = 300
+
+    def __init__(self, *, device: str = "cuda", precision: str = "bf16", torch_compile: bool = False) -> None:
         self.device = device
+        self.precision = precision
+        self.torch_compile = torch_compile
+        self._autocast = contextlib.nullcontext
         self._logger = get_logger("tts.backend.chatterbox")
         self._ensure_path()
         self._model = self._load_model()
+        # Synthesis runs on worker threads; the shared model is not re-entrant.
+        self._lock = threading.Lock()
+        if self.torch_compile:
+            self._compile_model()
 
     def _ensure_path(self) -> None:
         src_path = Path(__file__).resolve().parents[2] / "chatterbox" / "src"
@@ -85,14 +137,48 @@ class ChatterboxBackend(BaseBackend):
         import torch
 
         model = ChatterboxMultilingualTTS.from_pretrained(device=self.device)
+
+        # Reduced precision only pays off on CUDA tensor cores; weights stay in
+        # FP32 and autocast picks the matmul dtype per op.
+        if self.precision != "fp32" and str(self.device).startswith("cuda") and torch.cuda.is_available():
+            if self.precision == "bf16" and not torch.cuda.is_bf16_supported():
+                self.precision = "fp16"
+            dtype = torch.bfloat16 if self.precision == "bf16" else torch.float16
+            self._autocast = partial(torch.autocast, device_type="cuda", dtype=dtype)
+        else:
+            self.precision = "fp32"
+
         self._logger.info(
             "Loaded Chatterbox model",
             torch_version=torch.__version__,
             cuda_available=torch.cuda.is_available(),
             device=self.device,
+            precision=self.precision,
         )
         return model
 
+    def _compile_model(self) -> None:
+        """Compile the flow-matching estimator and warm it up.
+
+        The estimator runs once per diffusion step with the same graph, so it
+        benefits from kernel fusion. The T3 decode loop grows its KV cache and
+        hooks attention maps every step, so it is left in eager mode.
+        """
+        import torch
+
+        flow_decoder = self._model.s3gen.flow.decoder
+        eager_estimator = flow_decoder.estimator
+        try:
+            flow_decoder.estimator = torch.compile(eager_estimator, dynamic=True)
+            with self._autocast():
+                self._model.generate("Hello.", language_id="en")
+        except Exception as exc:  # noqa: broad-except - compilation is best effort
+            flow_decoder.estimator = eager_estimator
+            self._logger.warning("torch.compile unavailable, using eager Chatterbox", exc_info=exc)
+            self.torch_compile = False
+        else:
+            self._logger.info("Compiled Chatterbox flow estimator")
+
     def synthesize(
         self,
         *,
@@ -101,18 +187,32 @@ class ChatterboxBackend(BaseBackend):
         voice: str,
         speed: float,
         fmt: str,
-        output_file: Path,
     ):
         if fmt != "wav":
             raise ValueError("Chatterbox backend only supports WAV output today")
 
-        wav = self._model.generate(text, language_id=lang)
-        torchaudio.save(str(output_file), wav, self._model.sr)
-        yield {"done": True, "file": output_file, "format": fmt}
+        segments = _split_segments(text, self.segment_chars) or [text]
+        frames = 0
+        buffer = io.BytesIO()
+        with sf.SoundFile(
+            buffer, mode="w", samplerate=self._model.sr, channels=1, format="WAV", subtype="FLOAT"
+        ) as out:
+            for index, segment in enumerate(segments, 1):
+                with self._lock, self._autocast():
+                    wav = self._model.generate(segment, language_id=lang)
+                samples = wav.float().squeeze(0).numpy()
+                out.write(samples)
+                frames += len(samples)
+                yield KIND_PROGRESS, index / len(segments)
+        yield KIND_DONE, buffer.getvalue(), fmt, frames / self._model.sr
 
 
 def build_backend(config) -> BaseBackend:
     """Factory that returns the configured backend instance."""
     if getattr(config, "backend", "kokoro") == "chatterbox":
-        return ChatterboxBackend(device=getattr(config, "chatterbox_device", "cuda"))
+        return ChatterboxBackend(
+            device=getattr(config, "chatterbox_device", "cuda"),
+            precision=getattr(config, "chatterbox_precision", "bf16"),
+            torch_compile=getattr(config, "chatterbox_compile", False),
+        )
     return KokoroBackend(model_path=config.model_path, voices_path=config.voices_path)
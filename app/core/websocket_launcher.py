@@ -8,38 +8,118 @@ still delegating synthesis work to the legacy Kokoro implementation.
 from __future__ import annotations
 
 import asyncio
-import json
+import contextvars
+import hashlib
+import logging
+import secrets
 import signal
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Optional, Set, Tuple, Union
 from uuid import uuid4
 
-import soundfile as sf  # type: ignore
+import msgspec
+import orjson
 import websockets
+from cachetools import LRUCache
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 from websockets.server import WebSocketServerProtocol
 
-from app.core.backends import build_backend
-from app.monitoring.service_monitor import ServiceMonitor
-from app.utils.config import Config
+from app.core.backends import KIND_PROGRESS, BaseBackend, build_backend
+from app.monitoring.service_monitor import MonitoringServer, ServiceMonitor
+from app.utils.config import Config, load_config
 from app.utils.connection_manager import ConnectionManager
-from app.utils.logger import get_logger
+from app.utils.logger import REQUEST_ID, get_logger
+
+try:  # Optional: libuv-backed event loop for cheaper socket writes
+    import uvloop  # type: ignore
+except ImportError:  # pragma: no cover - falls back to the stock asyncio loop
+    uvloop = None
+
+_END_OF_STREAM = object()
+
+# Audio is sent in binary frames of at most this size, well under the 1 MiB
+# message limit that websockets clients apply by default.
+_AUDIO_CHUNK_BYTES = 512 * 1024
+
+# Error envelope serialised once; only the (already escaped) message varies.
+_ERROR_TEMPLATE = '{"status":"error","message":%s}'
+
+
+class TTSRequest(msgspec.Struct):
+    """Schema of an inbound synthesis request; unset options use config defaults."""
+
+    text: Optional[str] = None
+    lang: Optional[str] = None
+    voice: Optional[str] = None
+    speed: Optional[float] = None
+    format: Optional[str] = None
+    id: Optional[Union[str, int]] = None  # echoed on replies so pipelined requests can be told apart
+
+
+# strict=False keeps accepting numeric strings such as "1.2" for speed.
+_JSON_DECODER = msgspec.json.Decoder(TTSRequest, strict=False)
+_MSGPACK_DECODER = msgspec.msgpack.Decoder(TTSRequest, strict=False)
+
+
+def _decode_request(message: str | bytes) -> TTSRequest:
+    """Decode a request frame: JSON text, or MessagePack in a binary frame."""
+    if isinstance(message, (bytes, bytearray)) and message[:1] != b"{":
+        return _MSGPACK_DECODER.decode(message)
+    return _JSON_DECODER.decode(message)
 
 
 class WebSocketLauncher:
     """Lifecycle manager for the TTS WebSocket server."""
 
-    def __init__(self, config: Optional[Config] = None, monitor: Optional[ServiceMonitor] = None) -> None:
-        self.config = config or Config()
+    _ALLOWED_FORMATS = frozenset({"wav", "mp3"})
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        monitor: Optional[ServiceMonitor] = None,
+        monitoring_server: Optional[MonitoringServer] = None,
+    ) -> None:
+        self.config = config or load_config()
         self.monitor = monitor or ServiceMonitor()
+        # Served on the launcher's event loop alongside the WebSocket server.
+        self.monitoring_server = monitoring_server
         self.connection_manager = ConnectionManager(self.config.max_connections)
         self.logger = get_logger("tts.websocket")
-        self.backend = build_backend(self.config)
+        self._info_enabled = self.logger.logger.isEnabledFor(logging.INFO)
+        # Built in ``_run`` once the monitoring endpoints are up, so health
+        # probes answer while the model loads.
+        self.backend: Optional[BaseBackend] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._synth_executor: Optional[ThreadPoolExecutor] = None
 
-        signal.signal(signal.SIGINT, self._handle_signal)
-        signal.signal(signal.SIGTERM, self._handle_signal)
+        self._persist_outputs = self.config.persist_outputs
+        self._output_dir = Path(self.config.output_directory)
+        if self._persist_outputs:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Request defaults are fixed for the launcher's lifetime.
+        self._default_lang = self.config.default_language
+        self._default_voice = self.config.default_voice
+        self._default_speed = self.config.default_speed
+        self._default_format = self.config.default_format
+        self._is_chatterbox = self.config.backend == "chatterbox"
+
+        # Fixed rejection replies, encoded once.
+        self._err_bad_json = _ERROR_TEMPLATE % orjson.dumps("Invalid JSON payload").decode()
+        self._err_no_text = _ERROR_TEMPLATE % orjson.dumps("No text provided").decode()
+        self._err_chatterbox_wav = _ERROR_TEMPLATE % orjson.dumps("Chatterbox only supports WAV").decode()
+
+        # Final KIND_DONE updates keyed by request parameters, bounded by audio size.
+        self._tts_cache: Optional[LRUCache] = None
+        if self.config.synthesis_cache_mb > 0:
+            self._tts_cache = LRUCache(
+                maxsize=self.config.synthesis_cache_mb * 1024 * 1024,
+                getsizeof=lambda update: len(update[1]),
+            )
 
     # ----------------------------------------------------------------- lifecycle
     def start(self) -> None:
@@ -53,24 +133,76 @@ class WebSocketLauncher:
             host=self.config.host,
             port=self.config.port,
             max_connections=self.config.max_connections,
-            backend=self.backend.name,
+            backend=self.config.backend,
+            event_loop="uvloop" if self._use_uvloop() else "asyncio",
         )
 
+        if self._use_uvloop():
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
         try:
             asyncio.run(self._run())
         except KeyboardInterrupt:
             self.logger.info("TTS WebSocket server interrupted by user")
 
-    def _handle_signal(self, signum, _frame) -> None:
+    @staticmethod
+    def _use_uvloop() -> bool:
+        return uvloop is not None and sys.platform != "win32"
+
+    def _handle_signal(self, signum: int, stop: asyncio.Event) -> None:
         self.logger.info(f"Received signal {signum}, shutting down TTS WebSocket server")
-        if self._loop and self._loop.is_running():
-            self._loop.stop()
+        stop.set()
 
     async def _run(self) -> None:
         self._loop = asyncio.get_running_loop()
-        async with websockets.serve(self._handle_connection, self.config.host, self.config.port):
+        # Model runs get their own small pool, bounding how many (and their
+        # native thread pools) compete for the CPU/GPU; other blocking calls
+        # keep using the default executor and never queue behind them.
+        self._synth_executor = ThreadPoolExecutor(
+            max_workers=self.config.synthesis_workers, thread_name_prefix="tts-synth"
+        )
+
+        # Handle signals on the loop so shutdown runs through the normal
+        # coroutine cleanup instead of interrupting it from outside.
+        stop = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(signum, self._handle_signal, signum, stop)
+            except NotImplementedError:  # pragma: no cover - Windows loops; Ctrl+C raises instead
+                pass
+
+        monitoring = None
+        if self.monitoring_server is not None:
+            monitoring = asyncio.create_task(self.monitoring_server.serve())
+
+        if self.backend is None:
+            self.backend = await asyncio.to_thread(build_backend, self.config)
+
+        async with websockets.serve(
+            self._handle_connection,
+            self.config.host,
+            self.config.port,
+            compression=None,  # small JSON frames; deflate only costs CPU
+            max_size=65536,  # requests are text + options; reject oversized frames
+            max_queue=256,
+            ping_interval=20,
+            ping_timeout=20,
+            write_limit=2**20,
+        ):
             self.logger.info(f"TTS WebSocket server ready on ws://{self.config.host}:{self.config.port}")
-            await asyncio.Future()  # Run forever
+            self.monitor.ready = True
+            await stop.wait()
+            self.monitor.ready = False
+        # Leaving the serve() context closes open connections and waits for
+        # their handlers, so in-flight requests finish their bookkeeping.
+        if monitoring is not None:
+            self.monitoring_server.shutdown()
+            await monitoring
+        self.monitor.close()
+        # Any thread still running belongs to an abandoned request and stops
+        # at the backend's next update.
+        self._synth_executor.shutdown(wait=False, cancel_futures=True)
+        self.logger.info("TTS WebSocket server stopped")
 
     # ----------------------------------------------------------------- handlers
     async def _handle_connection(self, websocket: WebSocketServerProtocol) -> None:
@@ -89,10 +221,20 @@ class WebSocketLauncher:
         self.monitor.record_connection_open()
         self.logger.info("Client connected", session_id=session_id, client=remote)
 
+        # Requests on one connection run concurrently up to the configured cap;
+        # once it is reached, reading stalls until a synthesis finishes.
+        sem = asyncio.Semaphore(self.config.max_requests_per_connection)
+        pending: Set[asyncio.Task] = set()
+        # Every frame on the connection is sent under this lock so each
+        # request's audio frame and its "ok" frame stay back to back.
+        send_lock = asyncio.Lock()
         try:
             async for message in websocket:
                 self.connection_manager.record_message_received(session_id)
-                await self._process_message(websocket, session_id, message)
+                await sem.acquire()
+                task = asyncio.create_task(self._bounded_process(sem, send_lock, websocket, session_id, message))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
         except (ConnectionClosedOK, ConnectionClosedError):
             self.logger.info("Client disconnected", session_id=session_id, client=remote)
         except Exception as exc:  # noqa: broad-except - defensive guard
@@ -104,106 +246,161 @@ class WebSocketLauncher:
             )
             self.monitor.record_error()
         finally:
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
             self.connection_manager.remove_connection(session_id)
             self.monitor.record_connection_closed()
 
-    async def _process_message(self, websocket: WebSocketServerProtocol, session_id: str, message: str) -> None:
-        request_id = uuid4().hex
+    async def _bounded_process(
+        self,
+        sem: asyncio.Semaphore,
+        send_lock: asyncio.Lock,
+        websocket: WebSocketServerProtocol,
+        session_id: str,
+        message: str | bytes,
+    ) -> None:
+        """Run one request, releasing the connection's slot acquired by the reader."""
+        try:
+            await self._process_message(websocket, session_id, message, send_lock)
+        except (ConnectionClosedOK, ConnectionClosedError):
+            pass  # the reader loop logs the disconnect
+        except Exception as exc:  # noqa: broad-except - defensive guard
+            self.logger.error("Unexpected error while processing request", session_id=session_id, exc_info=exc)
+            self.monitor.record_error()
+        finally:
+            sem.release()
+
+    async def _process_message(
+        self,
+        websocket: WebSocketServerProtocol,
+        session_id: str,
+        message: str | bytes,
+        send_lock: asyncio.Lock,
+    ) -> None:
+        request_id = secrets.token_hex(4)  # 8 hex chars; only correlates log lines
         self.monitor.record_request()
 
-        with self.logger.request_context(request_id):
+        token = REQUEST_ID.set(request_id)
+        try:
             try:
-                payload = json.loads(message)
-            except json.JSONDecodeError:
+                request = _decode_request(message)
+            except msgspec.ValidationError as exc:
                 self.monitor.record_error()
-                await self._send_json(websocket, {"status": "error", "message": "Invalid JSON payload"})
+                await self._send_error(websocket, f"Invalid request: {exc}", lock=send_lock)
                 self.connection_manager.record_message_sent(session_id)
-                self.logger.warning("Rejected request due to invalid JSON", session_id=session_id)
+                self.logger.warning("Rejected request failing validation", session_id=session_id, reason=str(exc))
+                return
+            except msgspec.DecodeError:
+                self.monitor.record_error()
+                async with send_lock:
+                    await websocket.send(self._err_bad_json)
+                self.connection_manager.record_message_sent(session_id)
+                self.logger.warning("Rejected request due to invalid payload", session_id=session_id)
                 return
 
-            text = payload.get("text")
+            reply_id = request.id
+            text = request.text
             if not text:
                 self.monitor.record_error()
-                await self._send_json(websocket, {"status": "error", "message": "No text provided"})
+                await self._send_error(
+                    websocket, "No text provided", reply_id, encoded=self._err_no_text, lock=send_lock
+                )
                 self.connection_manager.record_message_sent(session_id)
                 self.logger.warning("Rejected request with missing text", session_id=session_id)
                 return
 
-            lang = payload.get("lang", self.config.default_language)
-            voice = payload.get("voice") or self.config.default_voice
-            speed_raw = payload.get("speed", self.config.default_speed)
-            fmt = (payload.get("format") or self.config.default_format).lower()
+            lang = request.lang or self._default_lang
+            voice = request.voice or self._default_voice
+            speed = self._default_speed if request.speed is None else request.speed
+            fmt = (request.format or self._default_format).lower()
 
-            try:
-                speed = float(speed_raw)
-            except (TypeError, ValueError):
-                speed = self.config.default_speed
-
-            if fmt not in {"wav", "mp3"}:
+            if fmt not in self._ALLOWED_FORMATS:
                 self.monitor.record_error()
-                await self._send_json(websocket, {"status": "error", "message": f"Unsupported format '{fmt}'"})
+                await self._send_error(websocket, f"Unsupported format '{fmt}'", reply_id, lock=send_lock)
                 self.connection_manager.record_message_sent(session_id)
                 self.logger.warning("Unsupported audio format", session_id=session_id, format=fmt)
                 return
 
-            if self.config.backend == "chatterbox" and fmt != "wav":
+            if self._is_chatterbox and fmt != "wav":
                 self.monitor.record_error()
-                await self._send_json(websocket, {"status": "error", "message": "Chatterbox only supports WAV"})
+                await self._send_error(
+                    websocket,
+                    "Chatterbox only supports WAV",
+                    reply_id,
+                    encoded=self._err_chatterbox_wav,
+                    lock=send_lock,
+                )
                 self.connection_manager.record_message_sent(session_id)
                 self.logger.warning("Unsupported audio format", session_id=session_id, format=fmt)
                 return
 
-            output_dir = Path(self.config.output_directory)
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_file = output_dir / f"{uuid4()}.{fmt}"
-
             success = False
             audio_duration = 0.0
             characters = len(text)
-            start_time = time.time()
+            processing_time: Optional[float] = None
+            start = time.perf_counter()
+
+            cache_key = None
+            cached = None
+            if self._tts_cache is not None:
+                cache_key = hashlib.blake2b(
+                    orjson.dumps((text, voice, speed, lang, fmt)), digest_size=16
+                ).digest()
+                cached = self._tts_cache.get(cache_key)
+                if cached is None:
+                    self.monitor.record_cache_miss()
+                else:
+                    self.monitor.record_cache_hit()
+
+            if cached is not None:
+                updates = self._replay(cached)
+            else:
+                updates = self._synthesize_in_thread(text=text, voice=voice, speed=speed, lang=lang, fmt=fmt)
 
             try:
-                for update in self.backend.synthesize(
-                    text=text,
-                    output_file=output_file,
-                    voice=voice,
-                    speed=speed,
-                    lang=lang,
-                    fmt=fmt,
-                ):
-                    if "progress" in update:
-                        await self._send_json(websocket, {"status": "progress", "progress": update["progress"]})
-                        self.connection_manager.record_message_sent(session_id)
-                    elif "done" in update:
-                        await self._send_json(
-                            websocket,
-                            {
-                                "status": "ok",
-                                "file": str(update["file"]),
-                                "format": update["format"],
-                            },
-                        )
+                async for update in updates:
+                    if update[0] == KIND_PROGRESS:
+                        async with send_lock:
+                            await self._send_json(
+                                websocket, {"status": "progress", "progress": update[1]}, reply_id
+                            )
                         self.connection_manager.record_message_sent(session_id)
+                    else:
+                        _, audio, out_fmt, duration = update
+                        if cache_key is not None and cached is None and len(audio) <= self._tts_cache.maxsize:
+                            self._tts_cache[cache_key] = update
+                        audio_duration = float(duration or 0.0)
+                        reply = {"status": "ok", "format": out_fmt, "duration": audio_duration}
+                        if self._persist_outputs:
+                            output_file = self._output_dir / f"{secrets.token_hex(16)}.{out_fmt}"
+                            await asyncio.to_thread(output_file.write_bytes, audio)
+                            reply["file"] = str(output_file)
+                        view = memoryview(audio)
+                        async with send_lock:
+                            for offset in range(0, len(view), _AUDIO_CHUNK_BYTES):
+                                await websocket.send(view[offset : offset + _AUDIO_CHUNK_BYTES])
+                            await self._send_json(websocket, reply, reply_id)
+                        now = time.monotonic()  # one reading for the audio and "ok" frames
+                        for _ in range(0, len(view), _AUDIO_CHUNK_BYTES):
+                            self.connection_manager.record_message_sent(session_id, now)
+                        self.connection_manager.record_message_sent(session_id, now)
                         success = True
-                        try:
-                            info = sf.info(str(update["file"]))
-                            audio_duration = float(getattr(info, "duration", 0.0) or 0.0)
-                        except Exception:  # noqa: broad-except - best effort
-                            audio_duration = 0.0
 
+                processing_time = time.perf_counter() - start
                 self.connection_manager.record_characters(session_id, characters)
-                self.logger.info(
-                    "Synthesis completed",
-                    session_id=session_id,
-                    characters=characters,
-                    voice=voice,
-                    language=lang,
-                    processing_time=round(time.time() - start_time, 3),
-                )
+                if self._info_enabled:
+                    self.logger.info(
+                        "Synthesis completed",
+                        session_id=session_id,
+                        characters=characters,
+                        voice=voice,
+                        language=lang,
+                        processing_time=round(processing_time, 3),
+                    )
             except Exception as exc:  # noqa: broad-except - surface the error to the client
                 self.monitor.record_error()
                 self.connection_manager.record_error(session_id)
-                await self._send_json(websocket, {"status": "error", "message": str(exc)})
+                await self._send_error(websocket, str(exc), reply_id, lock=send_lock)
                 self.connection_manager.record_message_sent(session_id)
                 self.logger.error(
                     "Synthesis failed",
@@ -214,14 +411,105 @@ class WebSocketLauncher:
                     exc_info=exc,
                 )
             finally:
-                processing_time = time.time() - start_time
-                self.monitor.record_synthesis(
-                    characters=characters,
-                    processing_time=processing_time,
-                    audio_duration=audio_duration,
-                    success=success,
-                )
+                # Stop the backend promptly if the send side gave up early.
+                await updates.aclose()
+                # Cache hits are counted in cache_hits; keep them out of the
+                # synthesis totals and averages.
+                if cached is None:
+                    if processing_time is None:  # failed or cancelled mid-synthesis
+                        processing_time = time.perf_counter() - start
+                    self.monitor.record_synthesis(
+                        characters=characters,
+                        processing_time=processing_time,
+                        audio_duration=audio_duration,
+                        success=success,
+                    )
+        finally:
+            REQUEST_ID.reset(token)
 
     # ----------------------------------------------------------------- helpers
-    async def _send_json(self, websocket: WebSocketServerProtocol, payload: dict) -> None:
-        await websocket.send(json.dumps(payload))
+    async def _synthesize_in_thread(self, **kwargs: Any) -> AsyncIterator[Tuple]:
+        """Drive the blocking backend generator on a worker thread.
+
+        Updates are handed back to the event loop as they are produced so other
+        connections keep being served while the model runs. Whatever has queued
+        up between wake-ups is drained at once, and progress values superseded
+        within that burst are dropped so the client gets one frame per burst.
+        If the consumer stops early, the backend is closed at its next update
+        so an abandoned request does not keep a worker thread busy.
+        """
+        loop = asyncio.get_running_loop()
+        updates: asyncio.Queue = asyncio.Queue()
+        abandoned = threading.Event()
+
+        def _drive() -> None:
+            stream = self.backend.synthesize(**kwargs)
+            try:
+                for update in stream:
+                    if abandoned.is_set():
+                        break
+                    loop.call_soon_threadsafe(updates.put_nowait, update)
+            finally:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+                loop.call_soon_threadsafe(updates.put_nowait, _END_OF_STREAM)
+
+        # Run in a copy of the current context so backend logs keep the request id.
+        worker = loop.run_in_executor(self._synth_executor, contextvars.copy_context().run, _drive)
+        try:
+            finished = False
+            while not finished:
+                batch = [await updates.get()]
+                while not updates.empty():
+                    batch.append(updates.get_nowait())
+
+                for index, update in enumerate(batch):
+                    if update is _END_OF_STREAM:
+                        finished = True
+                        break
+                    following = batch[index + 1] if index + 1 < len(batch) else _END_OF_STREAM
+                    if (
+                        update[0] == KIND_PROGRESS
+                        and following is not _END_OF_STREAM
+                        and following[0] == KIND_PROGRESS
+                    ):
+                        continue
+                    yield update
+            await worker  # surface backend exceptions to the caller
+        finally:
+            # A no-op once the backend has finished. Otherwise the consumer bailed
+            # out early (cancelling ``worker`` does not stop its thread), so stop
+            # the backend and let the thread wind down quietly.
+            abandoned.set()
+            if not worker.done():
+                worker.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+    @staticmethod
+    async def _replay(update: Tuple) -> AsyncIterator[Tuple]:
+        """Yield a cached KIND_DONE update in place of a synthesis run."""
+        yield update
+
+    async def _send_json(
+        self, websocket: WebSocketServerProtocol, payload: dict, reply_id: Union[str, int, None] = None
+    ) -> None:
+        if reply_id is not None:
+            payload["id"] = reply_id
+        # Decode so replies stay text frames, as existing clients expect.
+        await websocket.send(orjson.dumps(payload).decode())
+
+    async def _send_error(
+        self,
+        websocket: WebSocketServerProtocol,
+        message: str,
+        reply_id: Union[str, int, None] = None,
+        *,
+        encoded: Optional[str] = None,
+        lock: asyncio.Lock,
+    ) -> None:
+        """Send an error reply; ``encoded`` is a pre-built frame for ``message``."""
+        async with lock:
+            if reply_id is not None:
+                await self._send_json(websocket, {"status": "error", "message": message}, reply_id)
+                return
+            await websocket.send(encoded or _ERROR_TEMPLATE % orjson.dumps(message).decode())
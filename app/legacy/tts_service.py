@@ -1433,10 +1433,13 @@ def convert_text_to_audio_text(
     format="wav", 
     debug=False,
     model_path="kokoro-v1.0.onnx", 
-    voices_path="voices-v1.0.bin"
+    voices_path="voices-v1.0.bin",
+    kokoro=None
 ):
-    check_required_files(model_path, voices_path)
-    kokoro = Kokoro(model_path, voices_path)
+    # Callers that synthesise repeatedly pass a preloaded model to skip the load.
+    if kokoro is None:
+        check_required_files(model_path, voices_path)
+        kokoro = Kokoro(model_path, voices_path)
 
     lang = validate_language(lang, kokoro)
     if voice:
@@ -1450,7 +1453,7 @@ def convert_text_to_audio_text(
         output_file = os.path.join(output_dir, f"{uuid.uuid4()}.{format}")
 
     chunks = chunk_text(text, initial_chunk_size=1000)
-    all_samples = []
+    chunk_samples = []  # per-chunk arrays, joined with a single concatenate
     sample_rate = None
 
     for i, chunk in enumerate(chunks, 1):
@@ -1458,15 +1461,17 @@ def convert_text_to_audio_text(
             chunk, kokoro, voice, speed, lang,
             retry_count=0, debug=debug
         )
-        if samples is not None:
+        if samples is not None and len(samples):
             if sample_rate is None:
                 sample_rate = sr
-            all_samples.extend(samples)
+            chunk_samples.append(np.asarray(samples, dtype=np.float32))
         yield {"progress": i / len(chunks)}  # report progress as float (0-1)
 
-    if all_samples:
-        sf.write(output_file, all_samples, sample_rate)
-        yield {"done": True, "file": output_file, "format": format}
+    if chunk_samples:
+        audio = np.concatenate(chunk_samples)
+        # Explicit format so output_file may also be an in-memory buffer.
+        sf.write(output_file, audio, sample_rate, format=format.upper())
+        yield {"done": True, "file": output_file, "format": format, "duration": len(audio) / sample_rate}
     else:
         raise RuntimeError("No audio generated from text")
 
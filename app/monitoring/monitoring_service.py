@@ -18,7 +18,7 @@ def run_monitoring_service() -> None:
     parser = argparse.ArgumentParser(description="FastTalk TTS Monitoring Server")
     parser.add_argument("--port", type=int, help="Monitoring server port (default: config value)")
     parser.add_argument("--host", type=str, help="Monitoring host (default: config value)")
-    parser.add_argument("--debug", action="store_true", help="Run Flask in debug mode")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     args = parser.parse_args()
 
     try:
@@ -7,23 +7,60 @@ platform can query consistent endpoints across services.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import time
-from threading import Lock, Thread
-from typing import Any, Dict, Optional
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Iterator, Optional, Tuple
 
+import orjson
 import psutil
-from flask import Flask, jsonify
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 
 logger = logging.getLogger(__name__)
 
 
+def _json(payload: Dict[str, Any], status_code: int = 200) -> Response:
+    """Serialise a response body with orjson."""
+    return Response(orjson.dumps(payload), status_code=status_code, media_type="application/json")
+
+
+class _EmbeddedServer(uvicorn.Server):
+    """uvicorn server that leaves signal handling to the host event loop."""
+
+    @contextlib.contextmanager
+    def capture_signals(self) -> Iterator[None]:
+        yield
+
+
 class ServiceMonitor:
-    """Collects runtime metrics for the TTS service."""
+    """
+    Collects runtime metrics for the TTS service.
+
+    All ``record_*`` calls come from the WebSocket event loop, so counters have
+    a single writer and are updated without locking; readers on the monitoring
+    threads only ever observe whole values. The lock only keeps ``reset`` and
+    ``get_metrics`` from interleaving.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, sample_interval: float = 1.0) -> None:
         self._lock = Lock()
         self.reset()
+        # Set by the launcher once the backend is loaded and the WebSocket
+        # port is listening; cleared again on shutdown.
+        self.ready = False
+
+        # System usage is sampled in the background so health checks never block
+        # on psutil.cpu_percent's measurement window.
+        self.sample_interval = sample_interval
+        self._system: Tuple[float, Any] = (psutil.cpu_percent(interval=None), psutil.virtual_memory())
+        self._stop = Event()
+        self._sampler = Thread(target=self._sample_system, name="tts-system-sampler", daemon=True)
+        self._sampler.start()
 
     # ----------------------------------------------------------------- lifecycle
     def reset(self) -> None:
@@ -37,25 +74,33 @@ class ServiceMonitor:
             self.total_audio_duration = 0.0
             self.active_connections = 0
             self.peak_connections = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    def close(self) -> None:
+        """Stop the background system sampler."""
+        self._stop.set()
 
     # ---------------------------------------------------------------- metrics api
     def record_connection_open(self) -> None:
-        with self._lock:
-            self.active_connections += 1
-            if self.active_connections > self.peak_connections:
-                self.peak_connections = self.active_connections
+        self.active_connections += 1
+        if self.active_connections > self.peak_connections:
+            self.peak_connections = self.active_connections
 
     def record_connection_closed(self) -> None:
-        with self._lock:
-            self.active_connections = max(0, self.active_connections - 1)
+        self.active_connections = max(0, self.active_connections - 1)
 
     def record_request(self) -> None:
-        with self._lock:
-            self.request_count += 1
+        self.request_count += 1
 
     def record_error(self) -> None:
-        with self._lock:
-            self.error_count += 1
+        self.error_count += 1
+
+    def record_cache_hit(self) -> None:
+        self.cache_hits += 1
+
+    def record_cache_miss(self) -> None:
+        self.cache_misses += 1
 
     def record_synthesis(
         self,
@@ -65,60 +110,87 @@ class ServiceMonitor:
         audio_duration: float = 0.0,
         success: bool = True,
     ) -> None:
-        with self._lock:
-            self.synthesis_count += 1
-            self.total_characters += max(characters, 0)
-            self.total_processing_time += max(processing_time, 0.0)
-            self.total_audio_duration += max(audio_duration, 0.0)
+        self.synthesis_count += 1
+        self.total_characters += max(characters, 0)
+        self.total_processing_time += max(processing_time, 0.0)
+        self.total_audio_duration += max(audio_duration, 0.0)
+
+    def _sample_system(self) -> None:
+        # cpu_percent(None) measures since the previous call, i.e. across the wait.
+        while not self._stop.wait(self.sample_interval):
+            self._system = (psutil.cpu_percent(interval=None), psutil.virtual_memory())
 
     # ---------------------------------------------------------------- getters
+    def system_snapshot(self) -> Tuple[float, Any]:
+        """Return the latest sampled (cpu_percent, virtual_memory) pair."""
+        return self._system
+
     def uptime(self) -> float:
-        with self._lock:
-            return time.time() - self.start_time
+        return time.time() - self.start_time
 
     def get_metrics(self) -> Dict[str, Any]:
+        # Copy the counters under the lock; the arithmetic happens outside it.
         with self._lock:
-            avg_processing_time = (
-                self.total_processing_time / self.synthesis_count if self.synthesis_count else 0.0
-            )
-            avg_characters = self.total_characters / self.synthesis_count if self.synthesis_count else 0.0
-            avg_audio_duration = (
-                self.total_audio_duration / self.synthesis_count if self.synthesis_count else 0.0
+            (
+                start_time,
+                request_count,
+                synthesis_count,
+                error_count,
+                total_characters,
+                total_processing_time,
+                total_audio_duration,
+                active_connections,
+                peak_connections,
+                cache_hits,
+                cache_misses,
+            ) = (
+                self.start_time,
+                self.request_count,
+                self.synthesis_count,
+                self.error_count,
+                self.total_characters,
+                self.total_processing_time,
+                self.total_audio_duration,
+                self.active_connections,
+                self.peak_connections,
+                self.cache_hits,
+                self.cache_misses,
             )
 
-            return {
-                "uptime_seconds": self.uptime(),
-                "requests_total": self.request_count,
-                "syntheses_total": self.synthesis_count,
-                "errors_total": self.error_count,
-                "total_characters": self.total_characters,
-                "total_audio_duration_seconds": self.total_audio_duration,
-                "avg_processing_time_seconds": avg_processing_time,
-                "avg_characters": avg_characters,
-                "avg_audio_duration_seconds": avg_audio_duration,
-                "active_connections": self.active_connections,
-                "peak_connections": self.peak_connections,
-            }
+        inv = 1.0 / synthesis_count if synthesis_count else 0.0
+        return {
+            "uptime_seconds": time.time() - start_time,
+            "requests_total": request_count,
+            "syntheses_total": synthesis_count,
+            "errors_total": error_count,
+            "total_characters": total_characters,
+            "total_audio_duration_seconds": total_audio_duration,
+            "avg_processing_time_seconds": total_processing_time * inv,
+            "avg_characters": total_characters * inv,
+            "avg_audio_duration_seconds": total_audio_duration * inv,
+            "active_connections": active_connections,
+            "peak_connections": peak_connections,
+            "cache_hits": cache_hits,
+            "cache_misses": cache_misses,
+        }
 
 
 class MonitoringServer:
-    """Simple Flask server that exposes health and metrics endpoints."""
+    """Starlette app served by uvicorn that exposes health and metrics endpoints."""
 
     def __init__(self, host: str = "0.0.0.0", port: int = 9093, monitor: Optional[ServiceMonitor] = None) -> None:
         self.host = host
         self.port = port
         self.monitor = monitor or ServiceMonitor()
         self._thread: Optional[Thread] = None
-        self.app = Flask("tts-monitoring")
+        self._server: Optional[_EmbeddedServer] = None
         self._register_routes()
 
     # ----------------------------------------------------------------- routing
     def _register_routes(self) -> None:
-        @self.app.route("/health", methods=["GET"])
-        def health() -> Any:
+        async def health(request: Request) -> Response:
             """Combined health check with system metrics."""
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
+            cpu_percent, memory = self.monitor.system_snapshot()
 
             status = "healthy"
             warnings = []
@@ -133,7 +205,7 @@ class MonitoringServer:
             if warnings:
                 status = "degraded"
 
-            return jsonify(
+            return _json(
                 {
                     "status": status,
                     "uptime_seconds": self.monitor.uptime(),
@@ -147,35 +219,62 @@ class MonitoringServer:
                 }
             )
 
-        @self.app.route("/health/live", methods=["GET"])
-        def live() -> Any:
+        async def live(request: Request) -> Response:
             """Liveness probe."""
-            return jsonify({"status": "live"})
+            return _json({"status": "live"})
 
-        @self.app.route("/health/ready", methods=["GET"])
-        def ready() -> Any:
+        async def ready(request: Request) -> Response:
             """Readiness probe."""
-            return jsonify({"status": "ready" if self.monitor.active_connections >= 0 else "starting"})
+            if self.monitor.ready:
+                return _json({"status": "ready"})
+            return _json({"status": "starting"}, status_code=503)
 
-        @self.app.route("/metrics", methods=["GET"])
-        def metrics() -> Any:
+        async def metrics(request: Request) -> Response:
             """Expose collected runtime metrics."""
-            return jsonify(self.monitor.get_metrics())
+            return _json(self.monitor.get_metrics())
 
-        @self.app.route("/info", methods=["GET"])
-        def info() -> Any:
+        # Everything but the uptime is fixed, so serialise it once and leave
+        # the object open for the trailing field.
+        self._info_prefix = (
+            orjson.dumps({"service": "tts-service", "version": "1.0.0", "host": self.host, "port": self.port})[:-1]
+            + b',"uptime_seconds":'
+        )
+
+        async def info(request: Request) -> Response:
             """Basic service descriptor."""
-            return jsonify(
-                {
-                    "service": "tts-service",
-                    "version": "1.0.0",
-                    "host": self.host,
-                    "port": self.port,
-                    "uptime_seconds": self.monitor.uptime(),
-                }
-            )
+            body = self._info_prefix + format(self.monitor.uptime(), ".3f").encode() + b"}"
+            return Response(body, media_type="application/json")
+
+        self.app = Starlette(
+            routes=[
+                Route("/health", health, methods=["GET"]),
+                Route("/health/live", live, methods=["GET"]),
+                Route("/health/ready", ready, methods=["GET"]),
+                Route("/metrics", metrics, methods=["GET"]),
+                Route("/info", info, methods=["GET"]),
+            ]
+        )
 
     # ----------------------------------------------------------------- control
+    async def serve(self) -> None:
+        """Serve on the running event loop until :meth:`shutdown` is called."""
+        logger.info(f"Starting TTS monitoring server on {self.host}:{self.port}")
+        self._server = _EmbeddedServer(
+            uvicorn.Config(self.app, host=self.host, port=self.port, log_level="warning", lifespan="off")
+        )
+        try:
+            await self._server.serve()
+        except (OSError, SystemExit) as exc:
+            # uvicorn exits the process when it cannot bind; only monitoring
+            # is lost, so keep the TTS server running.
+            logger.error(f"TTS monitoring server failed on {self.host}:{self.port}: {exc!r}")
+
+    def shutdown(self) -> None:
+        """Ask a server started with :meth:`serve` to exit and stop sampling."""
+        if self._server is not None:
+            self._server.should_exit = True
+        self.monitor.close()
+
     def start(self) -> None:
         """Start the monitoring server in a background thread."""
         if self._thread and self._thread.is_alive():
@@ -183,7 +282,7 @@ class MonitoringServer:
 
         def _run() -> None:
             logger.info(f"Starting TTS monitoring server on {self.host}:{self.port}")
-            self.app.run(host=self.host, port=self.port, debug=False, use_reloader=False)
+            self._run_uvicorn(log_level="warning")
 
         self._thread = Thread(target=_run, daemon=True)
         self._thread.start()
@@ -191,4 +290,11 @@ class MonitoringServer:
     def run(self, debug: bool = False) -> None:
         """Run the monitoring server in the current thread."""
         logger.info(f"Running TTS monitoring server on {self.host}:{self.port}")
-        self.app.run(host=self.host, port=self.port, debug=debug, use_reloader=False)
+        try:
+            self._run_uvicorn(log_level="debug" if debug else "warning")
+        finally:
+            self.monitor.close()
+
+    def _run_uvicorn(self, *, log_level: str) -> None:
+        # "auto" picks uvloop when it is installed.
+        uvicorn.run(self.app, host=self.host, port=self.port, loop="auto", log_level=log_level, lifespan="off")
@@ -10,11 +10,15 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Set
 
 logger = logging.getLogger(__name__)
 
+# Directories already created by this process; later configs skip the syscalls.
+_ENSURED_DIRS: Set[str] = set()
+
 
 def _bool_env(var_name: str, default: bool) -> bool:
     """Parse boolean environment variables."""
@@ -24,47 +28,96 @@ def _bool_env(var_name: str, default: bool) -> bool:
     return value.lower() in {"1", "true", "yes", "on"}
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _env_snapshot() -> Mapping[str, Any]:
+    """
+    Parse every configuration variable once.
+
+    The environment is fixed after start-up, so repeated ``Config()`` calls
+    share these values; call ``_env_snapshot.cache_clear()`` after changing
+    ``os.environ`` at runtime.
+    """
+    return MappingProxyType(
+        {
+            "host": os.getenv("TTS_HOST", "0.0.0.0"),
+            "port": int(os.getenv("TTS_PORT", "8000")),
+            "monitoring_host": os.getenv("TTS_MONITORING_HOST", "0.0.0.0"),
+            "monitoring_port": int(os.getenv("TTS_MONITORING_PORT", "9093")),
+            "max_connections": int(os.getenv("TTS_MAX_CONNECTIONS", "50")),
+            "max_requests_per_connection": int(os.getenv("TTS_MAX_REQUESTS_PER_CONNECTION", "4")),
+            "synthesis_workers": int(os.getenv("TTS_SYNTHESIS_WORKERS", "2")),
+            "log_level": os.getenv("TTS_LOG_LEVEL", os.getenv("LOG_LEVEL", "INFO")),
+            "default_voice": os.getenv("TTS_DEFAULT_VOICE", "af_sarah"),
+            "default_language": os.getenv("TTS_DEFAULT_LANGUAGE", "en-us"),
+            "default_speed": float(os.getenv("TTS_DEFAULT_SPEED", "1.0")),
+            "default_format": os.getenv("TTS_DEFAULT_FORMAT", "wav"),
+            "allow_streaming": _bool_env("TTS_ALLOW_STREAMING", True),
+            "backend": os.getenv("TTS_BACKEND", "kokoro"),
+            "chatterbox_device": os.getenv("TTS_CHATTERBOX_DEVICE", "cuda"),
+            "chatterbox_precision": os.getenv("TTS_CHATTERBOX_PRECISION", "bf16"),
+            "chatterbox_compile": _bool_env("TTS_CHATTERBOX_COMPILE", False),
+            "model_path": os.getenv("TTS_MODEL_PATH", "kokoro-v1.0.onnx"),
+            "voices_path": os.getenv("TTS_VOICES_PATH", "voices-v1.0.bin"),
+            "output_directory": os.getenv("TTS_OUTPUT_DIR", "output"),
+            "persist_outputs": _bool_env("TTS_PERSIST_OUTPUTS", False),
+            "synthesis_cache_mb": int(os.getenv("TTS_SYNTHESIS_CACHE_MB", "64")),
+            "log_directory": os.getenv("TTS_LOG_DIR", "/app/logs"),
+        }
+    )
+
+
+def _from_env(key: str) -> Any:
+    """Field whose default comes from the environment snapshot."""
+    return field(default_factory=lambda: _env_snapshot()[key])
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """
     Configuration settings for the TTS microservice.
 
     The defaults align with the conventions described in PORT_CONFIGURATION.md
     and are compatible with the backend-orchestration docker-compose setup.
+    Instances are immutable; use :func:`load_config` (or ``dataclasses.replace``)
+    to derive a configuration with overrides.
     """
 
     # Server configuration -------------------------------------------------
-    host: str = field(default_factory=lambda: os.getenv("TTS_HOST", "0.0.0.0"))
-    port: int = field(default_factory=lambda: int(os.getenv("TTS_PORT", "8000")))
-    monitoring_host: str = field(default_factory=lambda: os.getenv("TTS_MONITORING_HOST", "0.0.0.0"))
-    monitoring_port: int = field(default_factory=lambda: int(os.getenv("TTS_MONITORING_PORT", "9093")))
-    max_connections: int = field(default_factory=lambda: int(os.getenv("TTS_MAX_CONNECTIONS", "50")))
-    log_level: str = field(default_factory=lambda: os.getenv("TTS_LOG_LEVEL", os.getenv("LOG_LEVEL", "INFO")))
+    host: str = _from_env("host")
+    port: int = _from_env("port")
+    monitoring_host: str = _from_env("monitoring_host")
+    monitoring_port: int = _from_env("monitoring_port")
+    max_connections: int = _from_env("max_connections")
+    max_requests_per_connection: int = _from_env("max_requests_per_connection")
+    synthesis_workers: int = _from_env("synthesis_workers")
+    log_level: str = _from_env("log_level")
 
     # Synthesis defaults ---------------------------------------------------
-    default_voice: str = field(default_factory=lambda: os.getenv("TTS_DEFAULT_VOICE", "af_sarah"))
-    default_language: str = field(default_factory=lambda: os.getenv("TTS_DEFAULT_LANGUAGE", "en-us"))
-    default_speed: float = field(default_factory=lambda: float(os.getenv("TTS_DEFAULT_SPEED", "1.0")))
-    default_format: str = field(default_factory=lambda: os.getenv("TTS_DEFAULT_FORMAT", "wav"))
-    allow_streaming: bool = field(default_factory=lambda: _bool_env("TTS_ALLOW_STREAMING", True))
+    default_voice: str = _from_env("default_voice")
+    default_language: str = _from_env("default_language")
+    default_speed: float = _from_env("default_speed")
+    default_format: str = _from_env("default_format")
+    allow_streaming: bool = _from_env("allow_streaming")
 
     # Backend selection ----------------------------------------------------
-    backend: str = field(default_factory=lambda: os.getenv("TTS_BACKEND", "kokoro"))
-    chatterbox_device: str = field(default_factory=lambda: os.getenv("TTS_CHATTERBOX_DEVICE", "cuda"))
+    backend: str = _from_env("backend")
+    chatterbox_device: str = _from_env("chatterbox_device")
+    chatterbox_precision: str = _from_env("chatterbox_precision")
+    chatterbox_compile: bool = _from_env("chatterbox_compile")
 
     # Model asset configuration -------------------------------------------
-    model_path: str = field(default_factory=lambda: os.getenv("TTS_MODEL_PATH", "kokoro-v1.0.onnx"))
-    voices_path: str = field(default_factory=lambda: os.getenv("TTS_VOICES_PATH", "voices-v1.0.bin"))
+    model_path: str = _from_env("model_path")
+    voices_path: str = _from_env("voices_path")
 
     # Storage --------------------------------------------------------------
-    output_directory: str = field(default_factory=lambda: os.getenv("TTS_OUTPUT_DIR", "output"))
-    log_directory: str = field(default_factory=lambda: os.getenv("TTS_LOG_DIR", "/app/logs"))
+    output_directory: str = _from_env("output_directory")
+    persist_outputs: bool = _from_env("persist_outputs")
+    synthesis_cache_mb: int = _from_env("synthesis_cache_mb")
+    log_directory: str = _from_env("log_directory")
 
     def __post_init__(self) -> None:
-        """Validate configuration and prepare runtime directories."""
+        """Validate configuration values."""
         self._validate()
-        self._ensure_directories()
-        self._log_summary()
 
     # ------------------------------------------------------------------ utils
     def _validate(self) -> None:
@@ -77,31 +130,42 @@ class Config:
             )
         if self.max_connections < 1:
             raise ValueError("TTS_MAX_CONNECTIONS must be at least 1.")
+        if self.max_requests_per_connection < 1:
+            raise ValueError("TTS_MAX_REQUESTS_PER_CONNECTION must be at least 1.")
+        if self.synthesis_workers < 1:
+            raise ValueError("TTS_SYNTHESIS_WORKERS must be at least 1.")
+        if self.synthesis_cache_mb < 0:
+            raise ValueError("TTS_SYNTHESIS_CACHE_MB must be 0 (disabled) or greater.")
         if self.default_format not in {"wav", "mp3"}:
             raise ValueError("TTS_DEFAULT_FORMAT must be either 'wav' or 'mp3'.")
         if self.backend not in {"kokoro", "chatterbox"}:
             raise ValueError("TTS_BACKEND must be either 'kokoro' or 'chatterbox'.")
+        if self.chatterbox_precision not in {"fp32", "fp16", "bf16"}:
+            raise ValueError("TTS_CHATTERBOX_PRECISION must be one of 'fp32', 'fp16' or 'bf16'.")
 
     def _ensure_directories(self) -> None:
         """Create directories required at runtime if they are missing."""
-        try:
-            Path(self.output_directory).mkdir(parents=True, exist_ok=True)
-        except OSError as exc:
-            logger.warning(f"Unable to ensure output directory {self.output_directory}: {exc}")
-
-        try:
-            Path(self.log_directory).mkdir(parents=True, exist_ok=True)
-        except OSError as exc:
-            logger.warning(f"Unable to ensure log directory {self.log_directory}: {exc}")
+        for directory in (self.output_directory, self.log_directory):
+            if directory in _ENSURED_DIRS:
+                continue
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError as exc:
+                logger.warning(f"Unable to ensure directory {directory}: {exc}")
+            else:
+                _ENSURED_DIRS.add(directory)
 
     def _log_summary(self) -> None:
         """Emit a concise configuration summary for diagnostics."""
         logger.info(
-            "TTS configuration: host=%s port=%s monitoring_port=%s max_connections=%s",
+            "TTS configuration: host=%s port=%s monitoring_port=%s max_connections=%s "
+            "max_requests_per_connection=%s synthesis_workers=%s",
             self.host,
             self.port,
             self.monitoring_port,
             self.max_connections,
+            self.max_requests_per_connection,
+            self.synthesis_workers,
         )
         logger.info(
             "TTS defaults: voice=%s language=%s speed=%s format=%s",
@@ -111,12 +175,20 @@ class Config:
             self.default_format,
         )
         logger.info(
-            "TTS assets: model=%s voices=%s output_dir=%s",
+            "TTS assets: model=%s voices=%s output_dir=%s persist_outputs=%s cache_mb=%s",
             self.model_path,
             self.voices_path,
             self.output_directory,
+            self.persist_outputs,
+            self.synthesis_cache_mb,
+        )
+        logger.info(
+            "TTS backend: %s (device=%s precision=%s compile=%s)",
+            self.backend,
+            self.chatterbox_device,
+            self.chatterbox_precision,
+            self.chatterbox_compile,
         )
-        logger.info("TTS backend: %s (device=%s)", self.backend, self.chatterbox_device)
 
     # ----------------------------------------------------------------- helpers
     def to_dict(self) -> Dict[str, Any]:
@@ -127,6 +199,8 @@ class Config:
             "monitoring_host": self.monitoring_host,
             "monitoring_port": self.monitoring_port,
             "max_connections": self.max_connections,
+            "max_requests_per_connection": self.max_requests_per_connection,
+            "synthesis_workers": self.synthesis_workers,
             "log_level": self.log_level,
             "default_voice": self.default_voice,
             "default_language": self.default_language,
@@ -134,14 +208,26 @@ class Config:
             "default_format": self.default_format,
             "backend": self.backend,
             "chatterbox_device": self.chatterbox_device,
+            "chatterbox_precision": self.chatterbox_precision,
+            "chatterbox_compile": self.chatterbox_compile,
             "model_path": self.model_path,
             "voices_path": self.voices_path,
             "output_directory": self.output_directory,
+            "persist_outputs": self.persist_outputs,
+            "synthesis_cache_mb": self.synthesis_cache_mb,
             "log_directory": self.log_directory,
             "allow_streaming": self.allow_streaming,
         }
 
 
-def load_config() -> Config:
-    """Convenience helper mirroring other microservices."""
-    return Config()
+def load_config(**overrides: Any) -> Config:
+    """
+    Build the service configuration from the environment.
+
+    Keyword arguments override individual fields (e.g. CLI flags). Runtime
+    directories are created and a summary is logged once for the final config.
+    """
+    config = Config(**overrides)
+    config._ensure_directories()
+    config._log_summary()
+    return config
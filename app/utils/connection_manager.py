@@ -3,6 +3,12 @@ WebSocket connection management utilities for the TTS service.
 
 The implementation mirrors the approach used in the other microservices so the
 backend orchestration layer can introspect connection metrics consistently.
+
+Concurrency contract: the lock guards membership of the connection table and
+the aggregate totals. Per-connection counters are only updated from the
+WebSocket event loop, so they have a single writer and are bumped without
+locking; lookups rely on ``dict.get`` being atomic under the GIL, and other
+threads reading a ``ConnectionInfo`` only ever see whole values.
 """
 
 from __future__ import annotations
@@ -11,7 +17,7 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from threading import Lock
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 class ConnectionState(Enum):
@@ -23,15 +29,18 @@ class ConnectionState(Enum):
     CLOSED = "closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionInfo:
-    """Metadata about a WebSocket connection."""
+    """Metadata about a WebSocket connection.
+
+    ``start_time`` and ``last_activity`` are ``time.monotonic()`` readings.
+    """
 
     session_id: str
     client: Optional[str] = None
     state: ConnectionState = ConnectionState.CONNECTING
-    start_time: float = field(default_factory=time.time)
-    last_activity: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)
+    last_activity: float = field(default_factory=time.monotonic)
 
     messages_received: int = 0
     messages_sent: int = 0
@@ -42,32 +51,38 @@ class ConnectionInfo:
 
     def mark_active(self) -> None:
         self.state = ConnectionState.ACTIVE
-        self.last_activity = time.time()
+        self.last_activity = time.monotonic()
 
     def mark_processing(self) -> None:
         self.state = ConnectionState.PROCESSING
-        self.last_activity = time.time()
+        self.last_activity = time.monotonic()
 
     def mark_closed(self) -> None:
         self.state = ConnectionState.CLOSED
-        self.last_activity = time.time()
+        self.last_activity = time.monotonic()
 
     def duration(self) -> float:
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
 
     def idle_time(self) -> float:
-        return time.time() - self.last_activity
+        return time.monotonic() - self.last_activity
 
 
 class ConnectionManager:
     """Thread-safe tracker for WebSocket connections."""
 
+    # Fold closed connections into the totals at least this often, so the
+    # queue stays bounded even if nobody calls ``snapshot``.
+    _FOLD_BATCH = 64
+
     def __init__(self, max_connections: int = 50):
         self.max_connections = max_connections
         self._connections: Dict[str, ConnectionInfo] = {}
         self._lock = Lock()
 
-        # Aggregate metrics
+        # Aggregate metrics. Closed connections are queued in ``_closed`` and
+        # folded into the ``total_*`` counters when ``snapshot`` is taken.
+        self._closed: List[ConnectionInfo] = []
         self.total_connections = 0
         self.total_disconnections = 0
         self.total_messages_received = 0
@@ -92,16 +107,13 @@ class ConnectionManager:
             info = self._connections.pop(session_id, None)
             if info:
                 info.mark_closed()
-                self.total_disconnections += 1
-                self.total_messages_received += info.messages_received
-                self.total_messages_sent += info.messages_sent
-                self.total_characters += info.characters_synthesised
-                self.total_errors += info.errors
+                self._closed.append(info)
+                if len(self._closed) >= self._FOLD_BATCH:
+                    self._fold_closed()
             return info
 
     def get(self, session_id: str) -> Optional[ConnectionInfo]:
-        with self._lock:
-            return self._connections.get(session_id)
+        return self._connections.get(session_id)
 
     def active_count(self) -> int:
         with self._lock:
@@ -110,6 +122,7 @@ class ConnectionManager:
     def snapshot(self) -> Dict[str, Any]:
         """Return a snapshot suitable for diagnostics/monitoring."""
         with self._lock:
+            self._fold_closed()
             return {
                 "active_connections": len(self._connections),
                 "max_connections": self.max_connections,
@@ -121,26 +134,37 @@ class ConnectionManager:
                 "total_errors": self.total_errors,
             }
 
+    def _fold_closed(self) -> None:
+        """Add queued closed connections to the aggregates; caller holds the lock."""
+        closed, self._closed = self._closed, []
+        if not closed:
+            return
+        self.total_disconnections += len(closed)
+        self.total_messages_received += sum(info.messages_received for info in closed)
+        self.total_messages_sent += sum(info.messages_sent for info in closed)
+        self.total_characters += sum(info.characters_synthesised for info in closed)
+        self.total_errors += sum(info.errors for info in closed)
+
     # ----------------------------------------------------------------- metrics
-    def record_message_received(self, session_id: str) -> None:
-        info = self.get(session_id)
+    def record_message_received(self, session_id: str, now: Optional[float] = None) -> None:
+        info = self._connections.get(session_id)
         if info:
             info.messages_received += 1
-            info.last_activity = time.time()
+            info.last_activity = time.monotonic() if now is None else now
 
-    def record_message_sent(self, session_id: str) -> None:
-        info = self.get(session_id)
+    def record_message_sent(self, session_id: str, now: Optional[float] = None) -> None:
+        info = self._connections.get(session_id)
         if info:
             info.messages_sent += 1
-            info.last_activity = time.time()
+            info.last_activity = time.monotonic() if now is None else now
 
     def record_characters(self, session_id: str, characters: int) -> None:
-        info = self.get(session_id)
+        info = self._connections.get(session_id)
         if info:
             info.characters_synthesised += characters
 
-    def record_error(self, session_id: str) -> None:
-        info = self.get(session_id)
+    def record_error(self, session_id: str, now: Optional[float] = None) -> None:
+        info = self._connections.get(session_id)
         if info:
             info.errors += 1
-            info.last_activity = time.time()
+            info.last_activity = time.monotonic() if now is None else now
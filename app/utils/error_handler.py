@@ -9,9 +9,10 @@ from __future__ import annotations
 
 import logging
 import time
-from collections import deque
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 from threading import Lock
 from typing import Any, Callable, Deque, Dict, List, Optional
 
@@ -39,7 +40,7 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorInfo:
     """Structured metadata about an error occurrence."""
 
@@ -47,9 +48,13 @@ class ErrorInfo:
     severity: ErrorSeverity
     message: str
     recoverable: bool
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = field(default_factory=time.monotonic)  # monotonic, not wall clock
     context: Dict[str, Any] = field(default_factory=dict)
     retry_after: Optional[float] = None
+    category_value: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.category_value = self.category.value
 
 
 class TTSError(Exception):
@@ -70,12 +75,14 @@ class TTSError(Exception):
         self.severity = severity
         self.recoverable = recoverable
         self.retry_after = retry_after
+        self._category_value = category.value
+        self._severity_value = severity.value
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "message": self.message,
-            "category": self.category.value,
-            "severity": self.severity.value,
+            "category": self._category_value,
+            "severity": self._severity_value,
             "recoverable": self.recoverable,
             "retry_after": self.retry_after,
         }
@@ -107,30 +114,35 @@ class CircuitBreaker:
 
     @property
     def state(self) -> CircuitBreakerState:
-        with self._lock:
-            self._maybe_reset()
-            return self._state
+        # Only an open breaker can change state on read (reset timeout).
+        if self._state is CircuitBreakerState.OPEN:
+            with self._lock:
+                self._maybe_reset()
+        return self._state
 
     def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
-        with self._lock:
-            self._maybe_reset()
-            if self._state == CircuitBreakerState.OPEN:
-                raise TTSError(
-                    f"Circuit breaker '{self.name}' is OPEN",
-                    category=ErrorCategory.RESOURCE,
-                    severity=ErrorSeverity.HIGH,
-                    recoverable=True,
-                    retry_after=self.reset_timeout,
-                )
+        # A closed breaker lets calls straight through; the unlocked read is a
+        # single reference load and a racing transition only affects this call.
+        if self._state is not CircuitBreakerState.CLOSED:
+            with self._lock:
+                self._maybe_reset()
+                if self._state is CircuitBreakerState.OPEN:
+                    raise TTSError(
+                        f"Circuit breaker '{self.name}' is OPEN",
+                        category=ErrorCategory.RESOURCE,
+                        severity=ErrorSeverity.HIGH,
+                        recoverable=True,
+                        retry_after=self.reset_timeout,
+                    )
 
         try:
             result = func(*args, **kwargs)
-        except Exception as exc:
+        except Exception:
             self._on_failure()
             raise
-        else:
+        if self._state is not CircuitBreakerState.CLOSED or self._failure_count:
             self._on_success()
-            return result
+        return result
 
     def _on_success(self) -> None:
         with self._lock:
@@ -143,7 +155,7 @@ class CircuitBreaker:
     def _on_failure(self) -> None:
         with self._lock:
             self._failure_count += 1
-            self._last_failure = time.time()
+            self._last_failure = time.monotonic()
 
             if self._failure_count >= self.failure_threshold:
                 if self._state != CircuitBreakerState.OPEN:
@@ -154,7 +166,7 @@ class CircuitBreaker:
 
     def _maybe_reset(self) -> None:
         if self._state == CircuitBreakerState.OPEN and self._last_failure is not None:
-            if (time.time() - self._last_failure) >= self.reset_timeout:
+            if (time.monotonic() - self._last_failure) >= self.reset_timeout:
                 logger.info(f"Circuit breaker '{self.name}' transitioning to HALF_OPEN")
                 self._state = CircuitBreakerState.HALF_OPEN
 
@@ -173,11 +185,9 @@ class ErrorTracker:
 
     def recent(self, limit: int = 20) -> List[ErrorInfo]:
         with self._lock:
-            return list(self._errors)[-limit:]
+            return list(islice(self._errors, max(0, len(self._errors) - limit), None))
 
     def counts_by_category(self) -> Dict[str, int]:
         with self._lock:
-            counts: Dict[str, int] = {}
-            for err in self._errors:
-                counts[err.category.value] = counts.get(err.category.value, 0) + 1
-            return counts
+            entries = list(self._errors)
+        return dict(Counter(err.category_value for err in entries))
@@ -7,24 +7,42 @@ formatter, matching the conventions established in the other microservices.
 
 from __future__ import annotations
 
-import json
 import logging
+import secrets
 import sys
+import threading
 import time
-import uuid
 from contextlib import contextmanager
 from contextvars import ContextVar
-from datetime import datetime, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Dict, Iterator, Optional
 
+import orjson
+
 REQUEST_ID: ContextVar[Optional[str]] = ContextVar("tts_request_id", default=None)
 
 
+@lru_cache(maxsize=4)
+def _utc_second(fmt: str, second: int) -> str:
+    """``strftime`` of a UTC epoch second; records in the same second reuse it."""
+    return time.strftime(fmt, time.gmtime(second))
+
+
 class JsonFormatter(logging.Formatter):
     """Emit structured log records as JSON for log aggregation pipelines."""
 
     def format(self, record: logging.LogRecord) -> str:
+        return self.encode(record).decode()
+
+    @staticmethod
+    def _timestamp(created: float) -> str:
+        """ISO-8601 UTC timestamp with microseconds."""
+        second = int(created)
+        prefix = _utc_second("%Y-%m-%dT%H:%M:%S", second)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """Serialise ``record`` straight to UTF-8 JSON bytes."""
         if isinstance(record.msg, dict):
             payload = record.msg.copy()
         else:
@@ -34,7 +52,7 @@ class JsonFormatter(logging.Formatter):
 
         payload.update(
             {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": self._timestamp(record.created),
                 "level": record.levelname,
                 "service": "tts-service",
                 "logger": record.name,
@@ -52,7 +70,25 @@ class JsonFormatter(logging.Formatter):
         if isinstance(extra_fields, dict):
             payload.update(extra_fields)
 
-        return json.dumps(payload)
+        # str() covers values orjson cannot serialise natively (paths, exceptions, ...).
+        return orjson.dumps(payload, default=str)
+
+
+class JsonFileHandler(logging.FileHandler):
+    """File handler writing :class:`JsonFormatter` bytes without re-encoding."""
+
+    def __init__(self, filename: str, delay: bool = False) -> None:
+        super().__init__(filename, mode="ab", delay=delay)
+        self.setFormatter(JsonFormatter())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.formatter.encode(record) + b"\n")
+            self.flush()
+        except Exception:  # noqa: broad-except - logging must never raise
+            self.handleError(record)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -67,17 +103,26 @@ class ConsoleFormatter(logging.Formatter):
         "RESET": "\033[0m",
     }
 
-    def format(self, record: logging.LogRecord) -> str:
-        colour = self._COLOURS.get(record.levelname, self._COLOURS["RESET"])
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
         reset = self._COLOURS["RESET"]
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        level = f"{colour}{record.levelname:8s}{reset}"
+        self._level_prefix = {
+            level: f"{colour}{level:8s}{reset}" for level, colour in self._COLOURS.items() if level != "RESET"
+        }
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = _utc_second("%Y-%m-%d %H:%M:%S", int(record.created))
+
+        level = self._level_prefix.get(record.levelname)
+        if level is None:
+            reset = self._COLOURS["RESET"]
+            level = f"{reset}{record.levelname:8s}{reset}"
         logger_name = f"{record.name:30s}"
         message = record.getMessage()
 
         request_id = REQUEST_ID.get()
         if request_id:
-            message = f"[{request_id[:8]}] {message}"
+            message = f"[{request_id}] {message}"
 
         formatted = f"{timestamp} | {level} | {logger_name} | {message}"
 
@@ -103,7 +148,8 @@ class StructuredLogger:
     ) -> None:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
-        self.logger.handlers.clear()
+        if self.logger.handlers:
+            self.logger.handlers.clear()
 
         if enable_console:
             stream_handler = logging.StreamHandler(sys.stdout)
@@ -111,9 +157,7 @@ class StructuredLogger:
             self.logger.addHandler(stream_handler)
 
         if enable_file and logfile:
-            file_handler = logging.FileHandler(logfile)
-            file_handler.setFormatter(JsonFormatter())
-            self.logger.addHandler(file_handler)
+            self.logger.addHandler(JsonFileHandler(logfile))
 
         self.logger.propagate = False
 
@@ -121,7 +165,7 @@ class StructuredLogger:
     @contextmanager
     def request_context(self, request_id: Optional[str] = None) -> Iterator[str]:
         """Context manager that sets a request id for correlated logging."""
-        token = REQUEST_ID.set(request_id or uuid.uuid4().hex)
+        token = REQUEST_ID.set(request_id or secrets.token_hex(4))
         try:
             yield REQUEST_ID.get() or ""
         finally:
@@ -129,18 +173,21 @@ class StructuredLogger:
 
     # ----------------------------------------------------------------- logging
     def _handle(self, level: int, message: str, **extra: Any) -> None:
-        record = self.logger.makeRecord(
-            name=self.logger.name,
-            level=level,
-            fn="",
-            lno=0,
-            msg=message,
-            args=(),
-            exc_info=extra.pop("exc_info", None),
-        )
+        logger = self.logger
+        if not logger.isEnabledFor(level):
+            return
+
+        # Normalise like Logger._log: formatters expect a (type, value, tb) tuple.
+        exc_info = extra.pop("exc_info", None)
+        if isinstance(exc_info, BaseException):
+            exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+        elif exc_info and not isinstance(exc_info, tuple):
+            exc_info = sys.exc_info()
+
+        record = logger.makeRecord(logger.name, level, "", 0, message, (), exc_info or None)
         if extra:
             record.extra_fields = extra
-        self.logger.handle(record)
+        logger.handle(record)
 
     def debug(self, message: str, **extra: Any) -> None:
         self._handle(logging.DEBUG, message, **extra)
@@ -159,36 +206,56 @@ class StructuredLogger:
         self._handle(logging.CRITICAL, message, **extra)
 
 
-_GLOBAL_LOGGER: Optional[StructuredLogger] = None
+def setup_logging(log_level: str = "INFO") -> None:
+    """
+    Route plain ``logging`` loggers through the console formatter.
+
+    Safe to call again, e.g. once the configured level is known; the handler
+    is only installed the first time.
+    """
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    if not any(isinstance(handler.formatter, ConsoleFormatter) for handler in root.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(ConsoleFormatter())
+        root.addHandler(handler)
+
+
+_LOGGERS: Dict[str, StructuredLogger] = {}
+_LOGGERS_LOCK = threading.Lock()
 
 
 def get_logger(name: str = "tts-service") -> StructuredLogger:
     """
     Obtain a structured logger instance.
 
-    Lazily initialises a global logger the first time it is requested so other
-    modules can reuse the same handler configuration.
+    Loggers are created once per name and shared afterwards, so repeated calls
+    reuse the same handlers instead of attaching new ones.
     """
-    global _GLOBAL_LOGGER
-    if _GLOBAL_LOGGER is None:
-        _GLOBAL_LOGGER = StructuredLogger(name="tts-service")
-    if name == "tts-service":
-        return _GLOBAL_LOGGER
-    return StructuredLogger(name)
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        with _LOGGERS_LOCK:
+            logger = _LOGGERS.get(name)
+            if logger is None:
+                logger = _LOGGERS[name] = StructuredLogger(name)
+    return logger
 
 
 def log_execution_time(logger: StructuredLogger):
     """Decorator to log execution durations for diagnostic purposes."""
 
     def decorator(func):
+        message = f"{func.__name__} completed"
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.time()
+            start = time.perf_counter_ns()
             try:
                 return func(*args, **kwargs)
             finally:
-                duration = time.time() - start
-                logger.debug(f"{func.__name__} completed", duration_seconds=round(duration, 4))
+                if logger.logger.isEnabledFor(logging.DEBUG):
+                    duration = (time.perf_counter_ns() - start) / 1e9
+                    logger.debug(message, duration_seconds=round(duration, 4))
 
         return wrapper
 
@@ -8,36 +8,32 @@ and local development share the same workflow.
 from __future__ import annotations
 
 import argparse
-import logging
 import sys
-from textwrap import dedent
 
-from app.core.websocket_launcher import WebSocketLauncher
-from app.monitoring.service_monitor import MonitoringServer, ServiceMonitor
-from app.utils.config import Config
-from app.utils.logger import get_logger
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    stream=sys.stdout,
+from app.utils.config import Config, load_config
+from app.utils.logger import setup_logging
+
+# argparse destination -> Config field for CLI overrides.
+_CLI_MAP = (
+    ("host", "host"),
+    ("port", "port"),
+    ("monitoring_host", "monitoring_host"),
+    ("monitoring_port", "monitoring_port"),
+    ("voice", "default_voice"),
+    ("language", "default_language"),
+    ("speed", "default_speed"),
+    ("log_level", "log_level"),
+    ("backend", "backend"),
+    ("chatterbox_device", "chatterbox_device"),
 )
 
-logger = get_logger(__name__)
-
 
 def _print_config(config: Config) -> None:
-    banner = "=" * 60
-    print(dedent(
-        f"""
-        {banner}
-        TTS Service Configuration
-        {banner}
-        """
-    ).strip())
-    for key, value in config.to_dict().items():
-        print(f"{key:30s}: {value}")
-    print(banner)
+    banner = "=" * 60 + "\n"
+    parts = [banner, "TTS Service Configuration\n", banner]
+    parts.extend(f"{key:30s}: {value}\n" for key, value in config.to_dict().items())
+    parts.append(banner)
+    sys.stdout.write("".join(parts))
 
 
 def main() -> None:
@@ -56,31 +52,17 @@ def main() -> None:
     parser.add_argument("--show", action="store_true", help="Display configuration (config mode)")
 
     args = parser.parse_args()
+    setup_logging()
+
+    overrides = {
+        config_field: value
+        for cli_attr, config_field in _CLI_MAP
+        if (value := getattr(args, cli_attr)) is not None
+    }
 
-    config = Config()
-
-    if args.host:
-        config.host = args.host
-    if args.port:
-        config.port = args.port
-    if args.monitoring_host:
-        config.monitoring_host = args.monitoring_host
-    if args.monitoring_port:
-        config.monitoring_port = args.monitoring_port
-    if args.voice:
-        config.default_voice = args.voice
-    if args.language:
-        config.default_language = args.language
-    if args.speed:
-        config.default_speed = args.speed
-    if args.log_level:
-        config.log_level = args.log_level
-    if args.backend:
-        config.backend = args.backend
-    if args.chatterbox_device:
-        config.chatterbox_device = args.chatterbox_device
-
-    logging.getLogger().setLevel(getattr(logging, config.log_level.upper(), logging.INFO))
+    config = load_config(**overrides)
+
+    setup_logging(config.log_level)
 
     if args.mode == "config":
         if args.show:
@@ -90,20 +72,17 @@ def main() -> None:
         return
 
     if args.mode == "websocket":
+        # Deferred so `config` mode does not load the server and model stacks.
+        from app.core.websocket_launcher import WebSocketLauncher
+        from app.monitoring.service_monitor import MonitoringServer, ServiceMonitor
+
         monitor = ServiceMonitor()
         monitoring_server = MonitoringServer(
             host=config.monitoring_host,
             port=config.monitoring_port,
             monitor=monitor,
         )
-        monitoring_server.start()
-        logger.info(
-            "Monitoring server started",
-            host=config.monitoring_host,
-            port=config.monitoring_port,
-        )
-
-        launcher = WebSocketLauncher(config=config, monitor=monitor)
+        launcher = WebSocketLauncher(config=config, monitor=monitor, monitoring_server=monitoring_server)
         launcher.start()
 
 